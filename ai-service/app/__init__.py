@@ -0,0 +1,3 @@
+"""
+KnowledgeGlow AI Service application package
+"""
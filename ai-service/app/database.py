@@ -5,149 +5,515 @@ Database management for KnowledgeGlow AI Service
 
 import sqlite3
 import os
+import asyncio
 import json
+import queue
+import aiosqlite
+import orjson
+from aiosqlitepool import SQLiteConnectionPool
+from cachetools import TTLCache
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from itertools import combinations
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 
 DATABASE_PATH = os.getenv("DATABASE_PATH", "./data/knowledge.db")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
 
-def get_db_connection():
-    """Get database connection with proper configuration"""
+# Larger pages mean shorter overflow chains for long content rows. Only
+# full-item reads and searches walk those chains: the list view is served
+# from idx_items_active_list and never reads content.
+PAGE_SIZE = 8192
+
+# Applied once when the pool opens a connection. page_size only takes effect
+# on a new database and must come before journal_mode=WAL; existing files
+# are converted by set_page_size().
+CONNECTION_PRAGMAS = (
+    f"PRAGMA page_size={PAGE_SIZE}",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824",
+)
+
+# Large enough to keep every KnowledgeDB statement (including all UPDATE
+# variants) prepared, so none is re-compiled per request
+STATEMENT_CACHE_SIZE = 128
+
+# Created by init_database(), closed by close_database()
+_pool: Optional[SQLiteConnectionPool] = None
+
+# Connection of the batch_writes() transaction running in this task, if any
+_transaction_conn: ContextVar[Optional[aiosqlite.Connection]] = ContextVar(
+    "transaction_conn", default=None)
+
+# Columns typed JSON (by declaration or a "[JSON]" column alias) come back
+# already decoded
+sqlite3.register_converter("JSON", orjson.loads)
+
+# Read results are cached for a short time. The key includes _data_version,
+# which every knowledge_items write bumps, so a write in this process
+# makes older cached results unreachable; the TTL bounds staleness from
+# writes made by other workers.
+CACHE_TTL_SECONDS = 30
+_data_version = 0
+_item_cache = TTLCache(maxsize=1024, ttl=CACHE_TTL_SECONDS)
+_stats_cache = TTLCache(maxsize=1, ttl=CACHE_TTL_SECONDS)
+
+def _bump_data_version():
+    global _data_version
+    _data_version += 1
+
+# Pending ai_processing_logs rows, written in batches by flush_processing_logs()
+_log_queue = queue.SimpleQueue()
+LOG_BATCH_SIZE = 256
+
+async def _write_log_batch(batch: List[tuple]):
+    """Insert queued log rows, putting them back on the queue if that fails"""
+    try:
+        async with batch_writes() as conn:
+            await conn.executemany(INSERT_LOG_SQL, batch)
+    except BaseException:
+        for row in batch:
+            _log_queue.put(row)
+        raise
+
+async def _connect() -> aiosqlite.Connection:
+    """Open a pooled connection with proper configuration"""
     # Ensure data directory exists
     os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
     
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
+    # Autocommit: reads run without an implicit BEGIN, writes go
+    # through batch_writes()
+    conn = await aiosqlite.connect(DATABASE_PATH, isolation_level=None,
+                                   cached_statements=STATEMENT_CACHE_SIZE,
+                                   detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+    for pragma in CONNECTION_PRAGMAS:
+        await conn.execute(pragma)
     return conn
 
-def init_database():
-    """Initialize database with schema"""
+@asynccontextmanager
+async def get_db_connection():
+    """Borrow a database connection from the pool"""
+    async with _pool.connection() as conn:
+        yield conn
+
+@asynccontextmanager
+async def batch_writes():
+    """Run writes in one BEGIN IMMEDIATE transaction, committed once on exit
+    
+    Use it around bulk inserts to pay for a single commit instead of one per
+    statement. Nested uses join the enclosing transaction.
+    """
+    conn = _transaction_conn.get()
+    if conn is not None:
+        yield conn
+        return
+    
+    async with get_db_connection() as conn:
+        await conn.execute("BEGIN IMMEDIATE")
+        token = _transaction_conn.set(conn)
+        try:
+            yield conn
+        except BaseException:
+            await conn.rollback()
+            raise
+        finally:
+            _transaction_conn.reset(token)
+        await conn.commit()
+
+async def init_database():
+    """Open the connection pool and initialize database with schema"""
+    global _pool
     try:
+        _pool = SQLiteConnectionPool(_connect, pool_size=DB_POOL_SIZE)
+        
+        await set_page_size()
+        
         # Read and execute schema
         schema_path = os.path.join(os.path.dirname(DATABASE_PATH), "init.sql")
         if os.path.exists(schema_path):
             with open(schema_path, 'r') as f:
                 schema = f.read()
             
-            conn = get_db_connection()
-            conn.executescript(schema)
-            conn.commit()
-            conn.close()
+            async with get_db_connection() as conn:
+                await conn.executescript(schema)
+            await create_search_index()
+            await create_tag_index()
             print(f"✅ Database initialized at {DATABASE_PATH}")
         else:
             # Create basic schema if init.sql doesn't exist
-            create_basic_schema()
+            await create_basic_schema()
+        
+        # Refresh planner statistics so the indexes above are used
+        async with get_db_connection() as conn:
+            await conn.execute("ANALYZE")
     except Exception as e:
         print(f"❌ Database initialization failed: {e}")
         raise
 
-def create_basic_schema():
+async def set_page_size():
+    """Rebuild a database created with another page size to use PAGE_SIZE"""
+    async with get_db_connection() as conn:
+        cursor = await conn.execute("PRAGMA page_size")
+        (page_size,) = await cursor.fetchone()
+        if page_size == PAGE_SIZE:
+            return
+        
+        # The page size of a WAL database is fixed, so leave WAL for the VACUUM
+        try:
+            await conn.execute("PRAGMA journal_mode=DELETE")
+            await conn.execute(f"PRAGMA page_size={PAGE_SIZE}")
+            await conn.execute("VACUUM")
+        except sqlite3.OperationalError as e:
+            # Another process has the database open; try again on next start
+            print(f"⚠️ Keeping page size {page_size}: {e}")
+        else:
+            print(f"✅ Database page size set to {PAGE_SIZE}")
+        finally:
+            await conn.execute("PRAGMA journal_mode=WAL")
+
+async def close_database():
+    """Close every pooled connection"""
+    if _pool is not None:
+        await _pool.close()
+
+async def create_basic_schema():
     """Create basic database schema"""
-    conn = get_db_connection()
-    
-    # Knowledge items table
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS knowledge_items (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            source_type TEXT NOT NULL CHECK (source_type IN ('text', 'url', 'file')),
-            source_url TEXT,
-            tags TEXT,
-            summary TEXT,
-            ai_analysis TEXT,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            is_active BOOLEAN DEFAULT 1
-        )
-    ''')
-    
-    # AI processing logs
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS ai_processing_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            knowledge_item_id INTEGER,
-            processing_type TEXT NOT NULL,
-            input_text TEXT,
-            output_text TEXT,
-            processing_time_ms INTEGER,
-            status TEXT DEFAULT 'success',
-            error_message TEXT,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (knowledge_item_id) REFERENCES knowledge_items(id) ON DELETE CASCADE
-        )
-    ''')
+    async with get_db_connection() as conn:
+        # Knowledge items table
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS knowledge_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                source_type TEXT NOT NULL CHECK (source_type IN ('text', 'url', 'file')),
+                source_url TEXT,
+                tags JSON,
+                summary TEXT,
+                ai_analysis TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                is_active BOOLEAN DEFAULT 1
+            )
+        ''')
+        
+        # Active items newest first, covering every SUMMARY_FIELDS column:
+        # the paginated list is an index-only range scan that never walks
+        # the content overflow pages stored before most of those columns
+        await conn.execute("DROP INDEX IF EXISTS idx_items_active_created")
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_items_active_list
+            ON knowledge_items(is_active, created_at DESC,
+                               title, summary, tags, source_type, updated_at)
+        ''')
+        
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_items_source_type
+            ON knowledge_items(source_type) WHERE is_active = 1
+        ''')
+        
+        # AI processing logs
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS ai_processing_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                knowledge_item_id INTEGER,
+                processing_type TEXT NOT NULL,
+                input_text TEXT,
+                output_text TEXT,
+                processing_time_ms INTEGER,
+                status TEXT DEFAULT 'success',
+                error_message TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (knowledge_item_id) REFERENCES knowledge_items(id) ON DELETE CASCADE
+            )
+        ''')
     
-    conn.commit()
-    conn.close()
+    await create_search_index()
+    await create_tag_index()
+
+async def create_search_index():
+    """Create the FTS5 search index over knowledge_items and keep it in sync"""
+    async with batch_writes() as conn:
+        cursor = await conn.execute('''
+            SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'knowledge_fts'
+        ''')
+        exists = await cursor.fetchone()
+        
+        # External-content table: the index stores only trigrams, the text stays
+        # in knowledge_items. Trigrams give the same substring matching as LIKE.
+        await conn.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts USING fts5(
+                title, content, summary,
+                content='knowledge_items',
+                content_rowid='id',
+                tokenize='trigram'
+            )
+        ''')
+        
+        await conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS knowledge_fts_insert AFTER INSERT ON knowledge_items BEGIN
+                INSERT INTO knowledge_fts (rowid, title, content, summary)
+                VALUES (new.id, new.title, new.content, new.summary);
+            END
+        ''')
+        
+        await conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS knowledge_fts_delete AFTER DELETE ON knowledge_items BEGIN
+                INSERT INTO knowledge_fts (knowledge_fts, rowid, title, content, summary)
+                VALUES ('delete', old.id, old.title, old.content, old.summary);
+            END
+        ''')
+        
+        await conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS knowledge_fts_update
+            AFTER UPDATE OF title, content, summary ON knowledge_items BEGIN
+                INSERT INTO knowledge_fts (knowledge_fts, rowid, title, content, summary)
+                VALUES ('delete', old.id, old.title, old.content, old.summary);
+                INSERT INTO knowledge_fts (rowid, title, content, summary)
+                VALUES (new.id, new.title, new.content, new.summary);
+            END
+        ''')
+        
+        # Index rows that were written before the search index existed
+        if not exists:
+            await conn.execute("INSERT INTO knowledge_fts (knowledge_fts) VALUES ('rebuild')")
+
+async def create_tag_index():
+    """Keep the tags / knowledge_item_tags relation in sync with active item tags"""
+    async with batch_writes() as conn:
+        cursor = await conn.execute('''
+            SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'knowledge_item_tags_insert'
+        ''')
+        exists = await cursor.fetchone()
+        
+        # Same tables as init.sql, for databases created by create_basic_schema()
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS tags (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL,
+                color TEXT DEFAULT '#007bff',
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS knowledge_item_tags (
+                knowledge_item_id INTEGER,
+                tag_id INTEGER,
+                PRIMARY KEY (knowledge_item_id, tag_id),
+                FOREIGN KEY (knowledge_item_id) REFERENCES knowledge_items(id) ON DELETE CASCADE,
+                FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
+            )
+        ''')
+        
+        # Tag counts are an indexed GROUP BY instead of parsing every tags array
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_knowledge_item_tags_tag_id
+            ON knowledge_item_tags(tag_id)
+        ''')
+        
+        # Only active items are linked. The tags JSON column stays the source
+        # of truth; these triggers derive the relation from it.
+        await conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS knowledge_item_tags_insert AFTER INSERT ON knowledge_items
+            WHEN new.tags IS NOT NULL AND new.is_active = 1 BEGIN
+                INSERT OR IGNORE INTO tags (name) SELECT value FROM json_each(new.tags);
+                INSERT OR IGNORE INTO knowledge_item_tags (knowledge_item_id, tag_id)
+                SELECT new.id, t.id FROM json_each(new.tags) j JOIN tags t ON t.name = j.value;
+            END
+        ''')
+        
+        await conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS knowledge_item_tags_delete AFTER DELETE ON knowledge_items BEGIN
+                DELETE FROM knowledge_item_tags WHERE knowledge_item_id = old.id;
+            END
+        ''')
+        
+        # Soft deletes go through here too: is_active = 0 unlinks the item's tags
+        await conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS knowledge_item_tags_update
+            AFTER UPDATE OF tags, is_active ON knowledge_items BEGIN
+                DELETE FROM knowledge_item_tags WHERE knowledge_item_id = old.id;
+                INSERT OR IGNORE INTO tags (name)
+                SELECT value FROM json_each(new.tags) WHERE new.is_active = 1;
+                INSERT OR IGNORE INTO knowledge_item_tags (knowledge_item_id, tag_id)
+                SELECT new.id, t.id FROM json_each(new.tags) j JOIN tags t ON t.name = j.value
+                WHERE new.is_active = 1;
+            END
+        ''')
+        
+        # Rebuild the links of rows written before the triggers existed
+        if not exists:
+            await conn.execute("DELETE FROM knowledge_item_tags")
+            await conn.execute('''
+                INSERT OR IGNORE INTO tags (name)
+                SELECT j.value FROM knowledge_items ki, json_each(ki.tags) j
+                WHERE ki.is_active = 1 AND ki.tags IS NOT NULL
+            ''')
+            await conn.execute('''
+                INSERT OR IGNORE INTO knowledge_item_tags (knowledge_item_id, tag_id)
+                SELECT ki.id, t.id FROM knowledge_items ki, json_each(ki.tags) j
+                JOIN tags t ON t.name = j.value
+                WHERE ki.is_active = 1 AND ki.tags IS NOT NULL
+            ''')
+
+# Columns of a knowledge item, in the order item queries select them
+ITEM_FIELDS = ('id', 'title', 'content', 'source_type', 'source_url', 'tags',
+               'summary', 'ai_analysis', 'created_at', 'updated_at', 'is_active')
+
+# Columns of a list entry: content and AI analysis are left out so SQLite
+# never reads their overflow pages for list views
+SUMMARY_FIELDS = ('id', 'title', 'summary', 'tags', 'source_type',
+                  'created_at', 'updated_at')
+
+def _item_columns(table: str = None, fields=ITEM_FIELDS) -> str:
+    prefix = f"{table}." if table else ""
+    columns = []
+    for field in fields:
+        if field == 'tags':
+            # The [JSON] alias makes the converter decode tags even in
+            # databases created before the column was declared JSON
+            columns.append(f'{prefix}tags AS "tags [JSON]"')
+        else:
+            columns.append(prefix + field)
+    return ', '.join(columns)
+
+def _rows_to_items(rows, fields=ITEM_FIELDS) -> List[Dict[str, Any]]:
+    return [dict(zip(fields, row)) for row in rows]
+
+# SQL statements used by KnowledgeDB. The text of each statement must stay
+# identical between calls so the connection's statement cache can reuse it.
+INSERT_ITEM_SQL = '''
+    INSERT INTO knowledge_items 
+    (title, content, source_type, source_url, tags, summary, ai_analysis)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+SELECT_ITEM_SQL = f'''
+    SELECT {_item_columns()} FROM knowledge_items WHERE id = ? AND is_active = 1
+'''
+
+LIST_ITEM_SUMMARIES_SQL = f'''
+    SELECT {_item_columns(fields=SUMMARY_FIELDS)} FROM knowledge_items 
+    WHERE is_active = 1 
+    ORDER BY created_at DESC 
+    LIMIT ? OFFSET ?
+'''
+
+DELETE_ITEM_SQL = '''
+    UPDATE knowledge_items 
+    SET is_active = 0, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ? AND is_active = 1
+'''
+
+SEARCH_ITEMS_SQL = f'''
+    SELECT {_item_columns('ki')} FROM knowledge_fts f 
+    JOIN knowledge_items ki ON ki.id = f.rowid 
+    WHERE knowledge_fts MATCH ? AND ki.is_active = 1 
+    ORDER BY bm25(knowledge_fts) 
+    LIMIT ?
+'''
+
+# The trigram index cannot match terms shorter than three characters
+SEARCH_ITEMS_LIKE_SQL = f'''
+    SELECT {_item_columns()} FROM knowledge_items 
+    WHERE is_active = 1 
+    AND (title LIKE ? OR content LIKE ? OR summary LIKE ?)
+    ORDER BY created_at DESC 
+    LIMIT ?
+'''
+
+FTS_MIN_QUERY_LENGTH = 3
+
+COUNT_BY_SOURCE_TYPE_SQL = '''
+    SELECT source_type, COUNT(*) FROM knowledge_items 
+    WHERE is_active = 1 
+    GROUP BY source_type
+'''
+
+TOP_TAGS_SQL = '''
+    SELECT t.name AS tag, COUNT(*) AS c FROM knowledge_item_tags kit 
+    JOIN tags t ON t.id = kit.tag_id 
+    GROUP BY kit.tag_id 
+    ORDER BY c DESC 
+    LIMIT ?
+'''
+
+INSERT_LOG_SQL = '''
+    INSERT INTO ai_processing_logs 
+    (knowledge_item_id, processing_type, input_text, output_text, 
+     processing_time_ms, status, error_message)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+UPDATABLE_COLUMNS = ('title', 'content', 'source_url', 'tags', 'summary', 'ai_analysis')
+
+def _build_update_sql(columns):
+    set_clauses = [f"{column} = ?" for column in columns]
+    set_clauses.append("updated_at = CURRENT_TIMESTAMP")
+    return f'''
+    UPDATE knowledge_items 
+    SET {', '.join(set_clauses)}
+    WHERE id = ? AND is_active = 1
+'''
+
+# One UPDATE statement per subset of updatable columns, keyed by the column
+# tuple in UPDATABLE_COLUMNS order
+UPDATE_ITEM_SQL = {
+    columns: _build_update_sql(columns)
+    for size in range(1, len(UPDATABLE_COLUMNS) + 1)
+    for columns in combinations(UPDATABLE_COLUMNS, size)
+}
 
 class KnowledgeDB:
     """Database operations for knowledge management"""
     
     @staticmethod
-    def create_knowledge_item(title: str, content: str, source_type: str, 
-                            source_url: str = None, tags: List[str] = None,
-                            summary: str = None, ai_analysis: str = None) -> int:
+    async def create_knowledge_item(title: str, content: str, source_type: str, 
+                                    source_url: str = None, tags: List[str] = None,
+                                    summary: str = None, ai_analysis: str = None) -> int:
         """Create a new knowledge item"""
-        conn = get_db_connection()
-        
         tags_json = json.dumps(tags) if tags else None
         
-        cursor = conn.execute('''
-            INSERT INTO knowledge_items 
-            (title, content, source_type, source_url, tags, summary, ai_analysis)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (title, content, source_type, source_url, tags_json, summary, ai_analysis))
+        async with batch_writes() as conn:
+            cursor = await conn.execute(INSERT_ITEM_SQL, (
+                title, content, source_type, source_url, tags_json, summary, ai_analysis))
         
-        item_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return item_id
+        _bump_data_version()
+        return cursor.lastrowid
     
     @staticmethod
-    def get_knowledge_item(item_id: int) -> Optional[Dict[str, Any]]:
-        """Get a knowledge item by ID"""
-        conn = get_db_connection()
-        
-        row = conn.execute('''
-            SELECT * FROM knowledge_items WHERE id = ? AND is_active = 1
-        ''', (item_id,)).fetchone()
-        
-        conn.close()
-        
-        if row:
-            item = dict(row)
-            if item['tags']:
-                item['tags'] = json.loads(item['tags'])
-            return item
-        return None
+    async def get_knowledge_item(item_id: int) -> Optional[Dict[str, Any]]:
+        """Get a knowledge item by ID (cached)"""
+        key = (_data_version, item_id)
+        if key in _item_cache:
+            return _item_cache[key]
+        
+        async with get_db_connection() as conn:
+            cursor = await conn.execute(SELECT_ITEM_SQL, (item_id,))
+            row = await cursor.fetchone()
+        
+        item = dict(zip(ITEM_FIELDS, row)) if row else None
+        _item_cache[key] = item
+        return item
     
     @staticmethod
-    def get_all_knowledge_items(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
-        """Get all knowledge items with pagination"""
-        conn = get_db_connection()
-        
-        rows = conn.execute('''
-            SELECT * FROM knowledge_items 
-            WHERE is_active = 1 
-            ORDER BY created_at DESC 
-            LIMIT ? OFFSET ?
-        ''', (limit, offset)).fetchall()
-        
-        conn.close()
-        
-        items = []
-        for row in rows:
-            item = dict(row)
-            if item['tags']:
-                item['tags'] = json.loads(item['tags'])
-            items.append(item)
-        
-        return items
+    async def list_knowledge_items(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """List knowledge items with pagination, without full content
+        
+        Each entry has SUMMARY_FIELDS; use get_knowledge_item for the full item.
+        """
+        async with get_db_connection() as conn:
+            rows = await conn.execute_fetchall(LIST_ITEM_SUMMARIES_SQL, (limit, offset))
+        
+        return _rows_to_items(rows, SUMMARY_FIELDS)
     
     @staticmethod
-    def update_knowledge_item(item_id: int, **kwargs) -> bool:
+    async def update_knowledge_item(item_id: int, **kwargs) -> bool:
         """Update a knowledge item"""
         if not kwargs:
             return False
@@ -156,94 +522,105 @@ class KnowledgeDB:
         if 'tags' in kwargs and isinstance(kwargs['tags'], list):
             kwargs['tags'] = json.dumps(kwargs['tags'])
         
-        # Build dynamic update query
-        set_clauses = []
-        values = []
+        # Pick the pre-built update query for the supplied columns
+        columns = tuple(key for key in UPDATABLE_COLUMNS if key in kwargs)
         
-        for key, value in kwargs.items():
-            if key in ['title', 'content', 'source_url', 'tags', 'summary', 'ai_analysis']:
-                set_clauses.append(f"{key} = ?")
-                values.append(value)
-        
-        if not set_clauses:
+        if not columns:
             return False
         
-        set_clauses.append("updated_at = CURRENT_TIMESTAMP")
+        query = UPDATE_ITEM_SQL[columns]
+        values = [kwargs[key] for key in columns]
         values.append(item_id)
         
-        query = f'''
-            UPDATE knowledge_items 
-            SET {', '.join(set_clauses)}
-            WHERE id = ? AND is_active = 1
-        '''
-        
-        conn = get_db_connection()
-        cursor = conn.execute(query, values)
-        affected = cursor.rowcount
-        conn.commit()
-        conn.close()
+        async with batch_writes() as conn:
+            cursor = await conn.execute(query, values)
         
-        return affected > 0
+        if cursor.rowcount > 0:
+            _bump_data_version()
+            return True
+        return False
     
     @staticmethod
-    def delete_knowledge_item(item_id: int) -> bool:
+    async def delete_knowledge_item(item_id: int) -> bool:
         """Soft delete a knowledge item"""
-        conn = get_db_connection()
+        async with batch_writes() as conn:
+            cursor = await conn.execute(DELETE_ITEM_SQL, (item_id,))
+        
+        if cursor.rowcount > 0:
+            _bump_data_version()
+            return True
+        return False
+    
+    @staticmethod
+    async def search_knowledge_items(query: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """Search knowledge items by content, best matches first"""
+        async with get_db_connection() as conn:
+            if len(query) >= FTS_MIN_QUERY_LENGTH:
+                # Quote as a single phrase so FTS5 operators in the query are literal
+                match_term = '"' + query.replace('"', '""') + '"'
+                rows = await conn.execute_fetchall(SEARCH_ITEMS_SQL, (match_term, limit))
+            else:
+                search_term = f"%{query}%"
+                rows = await conn.execute_fetchall(SEARCH_ITEMS_LIKE_SQL, (
+                    search_term, search_term, search_term, limit))
         
-        cursor = conn.execute('''
-            UPDATE knowledge_items 
-            SET is_active = 0, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ? AND is_active = 1
-        ''', (item_id,))
+        return _rows_to_items(rows)
+    
+    @staticmethod
+    async def count_by_source_type() -> Dict[str, int]:
+        """Count active knowledge items per source type"""
+        async with get_db_connection() as conn:
+            rows = await conn.execute_fetchall(COUNT_BY_SOURCE_TYPE_SQL)
         
-        affected = cursor.rowcount
-        conn.commit()
-        conn.close()
+        return {source_type: count for source_type, count in rows}
+    
+    @staticmethod
+    async def top_tags(n: int = 10) -> Dict[str, int]:
+        """Get the n most used tags on active knowledge items with their counts"""
+        async with get_db_connection() as conn:
+            rows = await conn.execute_fetchall(TOP_TAGS_SQL, (n,))
         
-        return affected > 0
+        return {tag: count for tag, count in rows}
     
     @staticmethod
-    def search_knowledge_items(query: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Search knowledge items by content"""
-        conn = get_db_connection()
-        
-        search_term = f"%{query}%"
-        rows = conn.execute('''
-            SELECT * FROM knowledge_items 
-            WHERE is_active = 1 
-            AND (title LIKE ? OR content LIKE ? OR summary LIKE ?)
-            ORDER BY created_at DESC 
-            LIMIT ?
-        ''', (search_term, search_term, search_term, limit)).fetchall()
-        
-        conn.close()
-        
-        items = []
-        for row in rows:
-            item = dict(row)
-            if item['tags']:
-                item['tags'] = json.loads(item['tags'])
-            items.append(item)
-        
-        return items
+    async def get_knowledge_stats() -> Dict[str, Any]:
+        """Get item counts per source type and the most used tags (cached)"""
+        key = _data_version
+        if key in _stats_cache:
+            return _stats_cache[key]
+        
+        # Every active item has exactly one source type
+        source_types = await KnowledgeDB.count_by_source_type()
+        
+        stats = {
+            "total_items": sum(source_types.values()),
+            "source_types": source_types,
+            "popular_tags": await KnowledgeDB.top_tags(10)
+        }
+        _stats_cache[key] = stats
+        return stats
     
     @staticmethod
     def log_ai_processing(knowledge_item_id: int, processing_type: str,
                          input_text: str, output_text: str, processing_time_ms: int,
-                         status: str = 'success', error_message: str = None) -> int:
-        """Log AI processing activity"""
-        conn = get_db_connection()
-        
-        cursor = conn.execute('''
-            INSERT INTO ai_processing_logs 
-            (knowledge_item_id, processing_type, input_text, output_text, 
-             processing_time_ms, status, error_message)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (knowledge_item_id, processing_type, input_text, output_text,
-              processing_time_ms, status, error_message))
-        
-        log_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return log_id
\ No newline at end of file
+                         status: str = 'success', error_message: str = None) -> None:
+        """Queue AI processing activity for the next batched log write"""
+        _log_queue.put((knowledge_item_id, processing_type, input_text, output_text,
+                        processing_time_ms, status, error_message))
+    
+    @staticmethod
+    async def flush_processing_logs() -> int:
+        """Write up to LOG_BATCH_SIZE queued logs in one transaction"""
+        batch = []
+        while len(batch) < LOG_BATCH_SIZE:
+            try:
+                batch.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        if batch:
+            # Shielded: a cancelled caller cannot interrupt the transaction,
+            # so the batch is either committed or requeued, never lost
+            await asyncio.shield(_write_log_batch(batch))
+        
+        return len(batch)
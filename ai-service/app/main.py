@@ -5,28 +5,56 @@ FastAPI-based AI processing service for knowledge management
 """
 
 import os
-import sys
+import asyncio
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager, suppress
 
-# Add the app directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from .database import init_database, close_database, KnowledgeDB
+from .routes.processing import router as processing_router, open_http_client, close_http_client
+from .routes.knowledge import router as knowledge_router
 
-from database import init_database
-from routes.processing import router as processing_router
-from routes.knowledge import router as knowledge_router
+# Static Web UI served by this app (index.html at /)
+WEB_UI_DIR = os.getenv(
+    "WEB_UI_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "web-ui")
+)
+
+# How often queued AI processing logs are written to the database
+LOG_FLUSH_INTERVAL = 0.1
+
+async def flush_processing_logs_periodically(stop: asyncio.Event):
+    """Drain the AI processing log queue in batches until stop is set"""
+    while not stop.is_set():
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(stop.wait(), LOG_FLUSH_INTERVAL)
+        try:
+            await KnowledgeDB.flush_processing_logs()
+        except Exception as e:
+            print(f"❌ Failed to write AI processing logs, will retry: {e}")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting KnowledgeGlow AI Service...")
-    init_database()
+    await init_database()
     print("✅ Database initialized")
+    open_http_client()
+    stop_flushing = asyncio.Event()
+    log_flusher = asyncio.create_task(flush_processing_logs_periodically(stop_flushing))
     yield
     # Shutdown
     print("🛑 Shutting down KnowledgeGlow AI Service...")
+    # Stop between flushes rather than cancelling one mid-transaction, then
+    # write whatever is still queued
+    stop_flushing.set()
+    await log_flusher
+    while await KnowledgeDB.flush_processing_logs():
+        pass
+    await close_database()
+    await close_http_client()
 
 # Create FastAPI app
 app = FastAPI(
@@ -49,7 +77,6 @@ app.add_middleware(
 app.include_router(processing_router, prefix="/api")
 app.include_router(knowledge_router, prefix="/api")
 
-@app.get("/")
 async def root():
     return {
         "service": "KnowledgeGlow AI Service",
@@ -64,13 +91,20 @@ async def health_check():
         "service": "ai-service"
     }
 
+# Mounted last so the API routes above take precedence
+if os.path.isdir(WEB_UI_DIR):
+    app.mount("/", StaticFiles(directory=WEB_UI_DIR, html=True), name="ui")
+else:
+    app.add_api_route("/", root)
+
 if __name__ == "__main__":
     port = int(os.getenv("AI_SERVICE_PORT", 59147))
     print(f"🤖 Starting AI Service on port {port}")
     uvicorn.run(
-        "main:app",
+        "app.main:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
+        # Development only: every change restarts the worker and re-imports the app
+        reload=os.getenv("AI_SERVICE_RELOAD", "false").lower() == "true",
         log_level="info"
     )
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""
+API routers for the KnowledgeGlow AI Service
+"""
@@ -3,13 +3,25 @@
 Knowledge management routes for KnowledgeGlow
 """
 
-from typing import List, Optional
+from typing import Any, List, Optional
+import orjson
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from database import KnowledgeDB
+from ..database import KnowledgeDB
 
 router = APIRouter()
 
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson
+    
+    List endpoints return this directly so rows go straight from dicts to
+    JSON bytes, without response-model validation and jsonable_encoder.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
 class KnowledgeItemCreate(BaseModel):
     title: str
     content: str
@@ -43,7 +55,7 @@ class KnowledgeItemResponse(BaseModel):
 async def create_knowledge_item(item: KnowledgeItemCreate):
     """Create a new knowledge item"""
     try:
-        item_id = KnowledgeDB.create_knowledge_item(
+        item_id = await KnowledgeDB.create_knowledge_item(
             title=item.title,
             content=item.content,
             source_type=item.source_type,
@@ -62,20 +74,24 @@ async def create_knowledge_item(item: KnowledgeItemCreate):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create knowledge item: {str(e)}")
 
-@router.get("/knowledge", response_model=List[dict])
+@router.get("/knowledge", response_model=List[dict], response_class=ORJSONResponse)
 async def get_knowledge_items(
     limit: int = Query(default=100, le=1000),
     offset: int = Query(default=0, ge=0),
     search: Optional[str] = Query(default=None)
 ):
-    """Get knowledge items with optional search"""
+    """Get knowledge items with optional search
+    
+    Without a search term, entries leave out content and ai_analysis;
+    GET /knowledge/{item_id} returns the whole item.
+    """
     try:
         if search:
-            items = KnowledgeDB.search_knowledge_items(search, limit)
+            items = await KnowledgeDB.search_knowledge_items(search, limit)
         else:
-            items = KnowledgeDB.get_all_knowledge_items(limit, offset)
+            items = await KnowledgeDB.list_knowledge_items(limit, offset)
         
-        return items
+        return ORJSONResponse(items)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve knowledge items: {str(e)}")
@@ -84,7 +100,7 @@ async def get_knowledge_items(
 async def get_knowledge_item(item_id: int):
     """Get a specific knowledge item"""
     try:
-        item = KnowledgeDB.get_knowledge_item(item_id)
+        item = await KnowledgeDB.get_knowledge_item(item_id)
         
         if not item:
             raise HTTPException(status_code=404, detail="Knowledge item not found")
@@ -106,7 +122,7 @@ async def update_knowledge_item(item_id: int, item: KnowledgeItemUpdate):
         if not update_data:
             raise HTTPException(status_code=400, detail="No update data provided")
         
-        success = KnowledgeDB.update_knowledge_item(item_id, **update_data)
+        success = await KnowledgeDB.update_knowledge_item(item_id, **update_data)
         
         if not success:
             raise HTTPException(status_code=404, detail="Knowledge item not found")
@@ -126,7 +142,7 @@ async def update_knowledge_item(item_id: int, item: KnowledgeItemUpdate):
 async def delete_knowledge_item(item_id: int):
     """Delete a knowledge item"""
     try:
-        success = KnowledgeDB.delete_knowledge_item(item_id)
+        success = await KnowledgeDB.delete_knowledge_item(item_id)
         
         if not success:
             raise HTTPException(status_code=404, detail="Knowledge item not found")
@@ -142,15 +158,15 @@ async def delete_knowledge_item(item_id: int):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete knowledge item: {str(e)}")
 
-@router.get("/knowledge/search/{query}", response_model=List[dict])
+@router.get("/knowledge/search/{query}", response_model=List[dict], response_class=ORJSONResponse)
 async def search_knowledge_items(
     query: str,
     limit: int = Query(default=50, le=500)
 ):
     """Search knowledge items"""
     try:
-        items = KnowledgeDB.search_knowledge_items(query, limit)
-        return items
+        items = await KnowledgeDB.search_knowledge_items(query, limit)
+        return ORJSONResponse(items)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -159,28 +175,10 @@ async def search_knowledge_items(
 async def get_knowledge_stats():
     """Get knowledge database statistics"""
     try:
-        # Get total count
-        items = KnowledgeDB.get_all_knowledge_items(limit=10000)  # Get all for counting
-        total_items = len(items)
-        
-        # Count by source type
-        source_types = {}
-        tags_count = {}
-        
-        for item in items:
-            # Count source types
-            source_type = item.get('source_type', 'unknown')
-            source_types[source_type] = source_types.get(source_type, 0) + 1
-            
-            # Count tags
-            if item.get('tags'):
-                for tag in item['tags']:
-                    tags_count[tag] = tags_count.get(tag, 0) + 1
+        stats = await KnowledgeDB.get_knowledge_stats()
         
         return {
-            "total_items": total_items,
-            "source_types": source_types,
-            "popular_tags": dict(sorted(tags_count.items(), key=lambda x: x[1], reverse=True)[:10]),
+            **stats,
             "status": "success"
         }
         
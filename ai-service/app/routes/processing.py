@@ -5,14 +5,59 @@ AI Processing routes for KnowledgeGlow
 
 import time
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-import requests
+import httpx
+from lxml import etree
 from urllib.parse import urlparse
+from ..database import KnowledgeDB
 
 router = APIRouter()
 
+MAX_EXTRACTED_CHARS = 5000
+DOWNLOAD_CHUNK_SIZE = 32768
+
+# Shared client so outbound fetches reuse pooled keep-alive connections;
+# created by open_http_client(), closed by close_http_client()
+http_client: Optional[httpx.AsyncClient] = None
+
+def open_http_client():
+    """Create the shared client for URL fetches"""
+    global http_client
+    http_client = httpx.AsyncClient(
+        headers={'User-Agent': 'KnowledgeGlow/1.0 (Knowledge Management Bot)'},
+        timeout=10,
+        follow_redirects=True
+    )
+
+async def close_http_client():
+    """Close the shared client and its pooled connections"""
+    global http_client
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+
+# Elements whose text is never part of the readable page
+SKIPPED_TAGS = {'script', 'style', 'noscript', 'template'}
+
+# Mock tagging: a tag is assigned when any of its keywords appears as a word
+TAG_KEYWORDS = {
+    'AI': ('ai', 'artificial intelligence', 'machine learning', 'ml'),
+    'Development': ('python', 'javascript', 'programming', 'code', 'development'),
+    'Database': ('database', 'sql', 'data'),
+    'Web': ('web', 'http', 'api', 'rest'),
+    'Research': ('research', 'study', 'analysis'),
+}
+
+# All keywords in one alternation, longest first, so a single scan finds them
+KEYWORD_PATTERN = re.compile(
+    r'\b(' + '|'.join(re.escape(keyword) for keyword in sorted(
+        {keyword for keywords in TAG_KEYWORDS.values() for keyword in keywords},
+        key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+
 class ProcessingRequest(BaseModel):
     text: str = ""
     url: str = ""
@@ -25,7 +70,52 @@ class ProcessingResponse(BaseModel):
     status: str
     error: str = ""
 
-def extract_text_from_url(url: str) -> str:
+class TextCollector:
+    """lxml parser target that collects up to `limit` characters of page text"""
+    
+    def __init__(self, limit: int = MAX_EXTRACTED_CHARS):
+        self.limit = limit
+        self.parts = []
+        self.length = 0
+        self.skip_depth = 0
+    
+    @property
+    def full(self) -> bool:
+        return self.length > self.limit
+    
+    def start(self, tag, attrib):
+        # Tags separate words, as the old tag-stripping regex did
+        self.parts.append(' ')
+        if tag in SKIPPED_TAGS:
+            self.skip_depth += 1
+    
+    def end(self, tag):
+        self.parts.append(' ')
+        if tag in SKIPPED_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+    
+    def data(self, data):
+        if not self.skip_depth and not self.full:
+            self.parts.append(data)
+    
+    def compact(self):
+        """Collapse whitespace in the text collected so far and update length"""
+        text = ' '.join(''.join(self.parts).split())
+        # Keep the normalized form so later calls only re-scan new data
+        self.parts = [text, ' '] if text else []
+        self.length = len(text)
+    
+    def close(self) -> str:
+        self.compact()
+        if not self.parts:
+            return ''
+        
+        text = self.parts[0]
+        if self.full:
+            return text[:self.limit] + "..."
+        return text
+
+async def extract_text_from_url(url: str) -> str:
     """Extract text content from URL (simplified implementation)"""
     try:
         # Validate URL
@@ -33,26 +123,25 @@ def extract_text_from_url(url: str) -> str:
         if not parsed.scheme or not parsed.netloc:
             raise ValueError("Invalid URL format")
         
-        # Simple HTTP request to get content
-        headers = {
-            'User-Agent': 'KnowledgeGlow/1.0 (Knowledge Management Bot)'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Simple text extraction (in production, use proper HTML parsing)
-        content = response.text
-        
-        # Remove HTML tags (basic implementation)
-        clean_text = re.sub(r'<[^>]+>', ' ', content)
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-        
-        # Limit content length
-        if len(clean_text) > 5000:
-            clean_text = clean_text[:5000] + "..."
-        
-        return clean_text
+        async with http_client.stream('GET', url) as response:
+            response.raise_for_status()
+            
+            # Only trust an explicit charset; otherwise let lxml detect it
+            encoding = response.charset_encoding
+            
+            # Parse raw bytes while downloading and stop once there is enough text.
+            # Each feed is a bounded chunk of C parsing, so it stays on the loop
+            # (lxml parsers must not move between threads).
+            collector = TextCollector()
+            parser = etree.HTMLParser(target=collector, encoding=encoding)
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                parser.feed(chunk)
+                collector.compact()
+                if collector.full:
+                    break
+            
+            # Text is limited to MAX_EXTRACTED_CHARS (plus "...") by the collector
+            return parser.close()
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to extract content from URL: {str(e)}")
@@ -60,9 +149,6 @@ def extract_text_from_url(url: str) -> str:
 def mock_ai_processing(text: str) -> Dict[str, Any]:
     """Mock AI processing (replace with actual OpenAI integration)"""
     
-    # Simulate processing time
-    time.sleep(0.5)
-    
     # Generate mock summary
     words = text.split()
     summary_length = min(50, len(words) // 3)
@@ -71,20 +157,8 @@ def mock_ai_processing(text: str) -> Dict[str, Any]:
         summary += "..."
     
     # Generate mock tags based on content
-    tags = []
-    text_lower = text.lower()
-    
-    # Technology tags
-    if any(word in text_lower for word in ['ai', 'artificial intelligence', 'machine learning', 'ml']):
-        tags.append('AI')
-    if any(word in text_lower for word in ['python', 'javascript', 'programming', 'code', 'development']):
-        tags.append('Development')
-    if any(word in text_lower for word in ['database', 'sql', 'data']):
-        tags.append('Database')
-    if any(word in text_lower for word in ['web', 'http', 'api', 'rest']):
-        tags.append('Web')
-    if any(word in text_lower for word in ['research', 'study', 'analysis']):
-        tags.append('Research')
+    found = {match.lower() for match in KEYWORD_PATTERN.findall(text)}
+    tags = [tag for tag, keywords in TAG_KEYWORDS.items() if not found.isdisjoint(keywords)]
     
     # Default tags if none found
     if not tags:
@@ -94,11 +168,11 @@ def mock_ai_processing(text: str) -> Dict[str, Any]:
     analysis = f"This content appears to be about {', '.join(tags).lower()}. "
     analysis += f"The text contains approximately {len(words)} words and covers "
     
-    if 'ai' in text_lower or 'artificial intelligence' in text_lower:
+    if 'ai' in found or 'artificial intelligence' in found:
         analysis += "artificial intelligence concepts and applications."
-    elif 'development' in text_lower or 'programming' in text_lower:
+    elif 'development' in found or 'programming' in found:
         analysis += "software development practices and methodologies."
-    elif 'database' in text_lower:
+    elif 'database' in found:
         analysis += "database design and management principles."
     else:
         analysis += "general knowledge and information."
@@ -118,7 +192,7 @@ async def process_content(request: ProcessingRequest):
         
         # Get text content based on source type
         if request.source_type == "url" and request.url:
-            text_content = extract_text_from_url(request.url)
+            text_content = await extract_text_from_url(request.url)
         elif request.source_type == "text" and request.text:
             text_content = request.text
         else:
@@ -133,6 +207,10 @@ async def process_content(request: ProcessingRequest):
         
         processing_time = int((time.time() - start_time) * 1000)
         
+        KnowledgeDB.log_ai_processing(
+            None, 'analysis', text_content[:MAX_EXTRACTED_CHARS],
+            ai_result['analysis'], processing_time)
+        
         return ProcessingResponse(
             summary=ai_result['summary'],
             tags=ai_result['tags'],
@@ -143,6 +221,9 @@ async def process_content(request: ProcessingRequest):
     except HTTPException:
         raise
     except Exception as e:
+        KnowledgeDB.log_ai_processing(
+            None, 'analysis', (request.url or request.text)[:MAX_EXTRACTED_CHARS], None,
+            int((time.time() - start_time) * 1000), status='error', error_message=str(e))
         return ProcessingResponse(
             summary="",
             tags=[],
@@ -8,7 +8,7 @@ CREATE TABLE IF NOT EXISTS knowledge_items (
     content TEXT NOT NULL,
     source_type TEXT NOT NULL CHECK (source_type IN ('text', 'url', 'file')),
     source_url TEXT,
-    tags TEXT, -- JSON array of tags
+    tags JSON, -- JSON array of tags
     summary TEXT,
     ai_analysis TEXT, -- AI-generated analysis
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -56,9 +56,14 @@ CREATE TABLE IF NOT EXISTS ai_processing_logs (
 );
 
 -- Indexes for better performance
-CREATE INDEX IF NOT EXISTS idx_knowledge_items_created_at ON knowledge_items(created_at);
-CREATE INDEX IF NOT EXISTS idx_knowledge_items_source_type ON knowledge_items(source_type);
-CREATE INDEX IF NOT EXISTS idx_knowledge_items_is_active ON knowledge_items(is_active);
+-- Superseded by idx_items_active_list and idx_items_source_type below
+DROP INDEX IF EXISTS idx_knowledge_items_created_at;
+DROP INDEX IF EXISTS idx_knowledge_items_source_type;
+DROP INDEX IF EXISTS idx_knowledge_items_is_active;
+DROP INDEX IF EXISTS idx_items_active_created;
+-- Covers the item list columns, so listing never reads content overflow pages
+CREATE INDEX IF NOT EXISTS idx_items_active_list ON knowledge_items(is_active, created_at DESC, title, summary, tags, source_type, updated_at);
+CREATE INDEX IF NOT EXISTS idx_items_source_type ON knowledge_items(source_type) WHERE is_active = 1;
 CREATE INDEX IF NOT EXISTS idx_search_history_created_at ON search_history(created_at);
 CREATE INDEX IF NOT EXISTS idx_ai_processing_logs_created_at ON ai_processing_logs(created_at);
 
@@ -18,7 +18,8 @@ NC='\033[0m' # No Color
 # Configuration
 GO_PORT=${GO_PORT:-50575}
 PYTHON_PORT=${PYTHON_PORT:-59147}
-WEBUI_PORT=${WEBUI_PORT:-8000}
+# The Web UI is served by the Python AI Service
+WEBUI_PORT=$PYTHON_PORT
 
 # Function to check if port is available
 check_port() {
@@ -65,17 +66,13 @@ cleanup() {
     if [ ! -z "$PYTHON_PID" ]; then
         kill $PYTHON_PID 2>/dev/null || true
     fi
-    if [ ! -z "$WEBUI_PID" ]; then
-        kill $WEBUI_PID 2>/dev/null || true
-    fi
     
     # Wait a moment for graceful shutdown
     sleep 2
     
     # Force kill if still running
     pkill -f "go-app/cmd/proxy" 2>/dev/null || true
-    pkill -f "ai-service/app/main.py" 2>/dev/null || true
-    pkill -f "web-ui/server.py" 2>/dev/null || true
+    pkill -f "python3 -m app.main" 2>/dev/null || true
     
     echo -e "${GREEN}✅ All services stopped${NC}"
     exit 0
@@ -88,7 +85,6 @@ trap cleanup SIGINT SIGTERM
 echo -e "${BLUE}🔍 Checking port availability...${NC}"
 check_port $GO_PORT || exit 1
 check_port $PYTHON_PORT || exit 1
-check_port $WEBUI_PORT || exit 1
 
 # Check dependencies
 echo -e "${BLUE}🔍 Checking dependencies...${NC}"
@@ -124,21 +120,12 @@ fi
 echo -e "${BLUE}🤖 Starting Python AI Service on port $PYTHON_PORT...${NC}"
 cd ai-service/app
 export AI_SERVICE_PORT=$PYTHON_PORT
-python3 main.py > ../../logs/ai-service.log 2>&1 &
+PYTHONPATH=.. python3 -m app.main > ../../logs/ai-service.log 2>&1 &
 PYTHON_PID=$!
 cd ../..
 
-# Start Web UI Server
-echo -e "${BLUE}🌐 Starting Web UI Server on port $WEBUI_PORT...${NC}"
-cd web-ui
-export WEBUI_PORT=$WEBUI_PORT
-python3 server.py > ../logs/web-ui.log 2>&1 &
-WEBUI_PID=$!
-cd ..
-
 # Wait for services to be ready
 wait_for_service "http://localhost:$PYTHON_PORT/health" "Python AI Service"
-wait_for_service "http://localhost:$WEBUI_PORT/health" "Web UI Server"
 
 # Build and start Go Proxy Server
 echo -e "${BLUE}🔧 Building Go Proxy Server...${NC}"
@@ -187,11 +174,5 @@ while true; do
         exit 1
     fi
     
-    if ! kill -0 $WEBUI_PID 2>/dev/null; then
-        echo -e "${RED}❌ Web UI Server stopped unexpectedly${NC}"
-        cleanup
-        exit 1
-    fi
-    
     sleep 5
 done
\ No newline at end of file